@@ -10,30 +10,59 @@ Workflow:
 1.  Scans the local DICOM export directory to find existing session folders.
 2.  Connects to the scanner via SSH using paramiko.
 3.  For each local session, looks for a matching RRDF folder on the scanner.
-4.  Downloads the matching RRDF folder via SCP.
+4.  Downloads the matching RRDF folder as a single tar stream over SSH.
 5.  Matches each downloaded .h5 file to its corresponding DICOM acquisition
     folder by comparing timestamps.
 6.  Relocates the .h5 file and renames it to match the acquisition.
 7.  Performs special renaming for CALIPR series DICOM files.
 """
 import paramiko
-from scp import SCPClient
 import sys
 import datetime
 import os
 import glob
 import shutil
 import re
+import tarfile
+import stat
+from concurrent.futures import ThreadPoolExecutor
 import pydicom
 import json
+import bisect
+import logging
+import argparse
+
+logger = logging.getLogger(__name__)
 
 # --- Configuration ---
 DICOM_EXPORT_ROOT = '/var/lib/orthanc/export'
-TEMP_DOWNLOAD_DIR = '/tmp/rrdf_download'
+# Stage downloads on the export filesystem so relocating .h5 files is a rename, not a copy.
+# It sits at the export root, outside every study folder that gets uploaded.
+TEMP_DOWNLOAD_DIR = os.path.join(DICOM_EXPORT_ROOT, '.rrdf_staging')
 NETWORK_CONFIG_PATH = '/usr/share/orthanc/network_config.json'
 
 # Scanner connection details (IP is loaded dynamically)
 SWOOP_PORT, SWOOP_USER, SWOOP_PASS = 25125, 'rrdf', 'RawSCP'
+# Parallel SFTP channels used when the tar download is unavailable (sshd MaxSessions defaults to 10)
+SFTP_CHANNELS = 8
+# Read/write chunk size for the tar download stream (tarfile defaults to 10-16 KB)
+DOWNLOAD_BUFFER_SIZE = 128 * 1024
+# Session folders sit at export/<study>/<subject>/<session> (see export.lua)
+SESSION_FOLDER_DEPTH = 3
+# Concurrent DICOM header reads when scanning a session's acquisition folders
+DICOM_READ_WORKERS = 8
+# Read buffer for DICOM header reads; only the first few KB of each file are needed
+DICOM_READ_BUFFER_SIZE = 8192
+# Largest DICOM/RRDF time offset (in microseconds) still accepted as a match
+MAX_MATCH_OFFSET_US = 60 * 1000000
+# Offsets below this are treated as an exact match (RRDF filenames have 1 s resolution)
+EXACT_MATCH_OFFSET_US = 500000
+
+# Filename patterns, compiled once at import
+# .h5 files carry their acquisition time as _YYYYMMDD_HHMMSS.h5
+RRDF_FILE_PATTERN = re.compile(r'_(\d{4})(\d{2})(\d{2})_(\d{2})(\d{2})(\d{2})\.h5')
+# Session folders follow the YYYY-MM-DD_HH_MM_SS date format used in export.lua
+SESSION_FOLDER_PATTERN = re.compile(r'(\d{4})-(\d{2})-(\d{2})_(\d{2})_(\d{2})_(\d{2})')
 
 def get_scanner_ip():
     """Reads the scanner IP from the network config file."""
@@ -50,63 +79,97 @@ def get_scanner_ip():
         sys.exit(1)
 
 
-def rename_calipr_dicom_files(acquisition_folder_path):
+def list_dicom_files(folder_path):
+    """Lists the .dcm files directly inside a folder, skipping hidden files like glob does."""
+    with os.scandir(folder_path) as entries:
+        return [e.path for e in entries if e.name.endswith('.dcm') and not e.name.startswith('.')]
+
+
+def rename_calipr_dicom_files(acquisition_folder_path, dcm_files=None):
     """
     Renames the two DICOM files in a CALIPR acquisition folder based on
     their ContentTime tag, identifying them as protonDensity and T2map.
+    dcm_files may pass in the folder's DICOM files if they are already known.
+    Returns the renamed file paths, or None if the files were not renamed.
     """
-    print(f"  Performing special CALIPR DICOM renaming in: '{os.path.basename(os.path.normpath(acquisition_folder_path))}'")
+    base_name = os.path.basename(os.path.normpath(acquisition_folder_path))
+    logger.debug("  Performing special CALIPR DICOM renaming in: '%s'", base_name)
 
     # Find the two DICOM files in the folder.
-    dcm_files = glob.glob(os.path.join(acquisition_folder_path, '*.dcm'))
+    if dcm_files is None:
+        dcm_files = list_dicom_files(acquisition_folder_path)
     if len(dcm_files) != 2:
-        print(f"  Warning: Expected 2 DICOM files for CALIPR renaming, but found {len(dcm_files)}. Skipping.")
+        logger.warning("  Warning: Expected 2 DICOM files for CALIPR renaming, but found %s. Skipping.", len(dcm_files))
         return
 
     # Read the ContentTime from each file to determine its type.
     file_times = []
     try:
         for f_path in dcm_files:
-            dcm = pydicom.dcmread(f_path)
+            with open(f_path, 'rb', buffering=DICOM_READ_BUFFER_SIZE) as fp:
+                dcm = pydicom.dcmread(fp, stop_before_pixels=True, specific_tags=['ContentTime'])
             content_time_str = dcm.ContentTime
             file_times.append({'path': f_path, 'time': float(content_time_str)})
     except Exception as e:
-        print(f"  Error reading ContentTime from CALIPR DICOMs: {e}. Skipping rename.")
+        logger.warning("  Error reading ContentTime from CALIPR DICOMs: %s. Skipping rename.", e)
         return
 
-    # Sort by time: the earlier file is protonDensity, the later is T2map.
-    file_times.sort(key=lambda x: x['time'])
+    # Order by time: the earlier file is protonDensity, the later is T2map.
+    if file_times[0]['time'] > file_times[1]['time']:
+        file_times[0], file_times[1] = file_times[1], file_times[0]
     protonDensity_path = file_times[0]['path']
     T2map_path = file_times[1]['path']
 
     # Rename the files based on the acquisition folder's name.
-    base_name = os.path.basename(os.path.normpath(acquisition_folder_path))
-    new_protonDensity_path = os.path.join(acquisition_folder_path, f"{base_name}_protonDensity.dcm")
-    new_T2map_path = os.path.join(acquisition_folder_path, f"{base_name}_T2map.dcm")
+    new_protonDensity_name = f"{base_name}_protonDensity.dcm"
+    new_T2map_name = f"{base_name}_T2map.dcm"
+    new_protonDensity_path = os.path.join(acquisition_folder_path, new_protonDensity_name)
+    new_T2map_path = os.path.join(acquisition_folder_path, new_T2map_name)
     try:
-        print(f"  Renaming protonDensity file -> '{os.path.basename(new_protonDensity_path)}'")
+        logger.debug("  Renaming protonDensity file -> '%s'", new_protonDensity_name)
         os.rename(protonDensity_path, new_protonDensity_path)
-        print(f"  Renaming T2map file -> '{os.path.basename(new_T2map_path)}'")
+        logger.debug("  Renaming T2map file -> '%s'", new_T2map_name)
         os.rename(T2map_path, new_T2map_path)
     except Exception as e:
-        print(f"  Error during CALIPR DICOM rename: {e}")
+        logger.error("  Error during CALIPR DICOM rename: %s", e)
+        return None
+    return [new_protonDensity_path, new_T2map_path]
+
+
+def read_acquisition_time(folder_path):
+    """
+    Returns the AcquisitionDateTime of the first DICOM file in an acquisition
+    folder together with the folder's DICOM file list, or None.
+    """
+    try:
+        dicom_files = list_dicom_files(folder_path)
+    except OSError as e:
+        logger.warning("Warning: Could not list DICOM files in %s. Error: %s", folder_path, e)
+        return None
+    if not dicom_files:
+        return None
+    try:
+        with open(dicom_files[0], 'rb', buffering=DICOM_READ_BUFFER_SIZE) as fp:
+            dcm = pydicom.dcmread(fp, stop_before_pixels=True, specific_tags=['AcquisitionDateTime'])
+        # Use AcquisitionDateTime for precise matching.
+        acq_datetime = datetime.datetime.strptime(dcm.AcquisitionDateTime, "%Y%m%d%H%M%S.%f")
+        return acq_datetime, dicom_files
+    except Exception as e:
+        logger.warning("Warning: Could not read DICOM metadata for %s. Error: %s", dicom_files[0], e)
+        return None
 
 
 def get_dicom_acquisition_times(session_path):
-    """Scans a session's subfolders to extract acquisition datetimes from DICOM metadata."""
-    acq_times = {}
-    for folder_path in glob.glob(os.path.join(session_path, '*/')):
-        dicom_files = glob.glob(os.path.join(folder_path, '*.dcm'))
-        if not dicom_files:
-            continue
-        try:
-            dcm = pydicom.dcmread(dicom_files[0])
-            # Use AcquisitionDateTime for precise matching.
-            acq_datetime = datetime.datetime.strptime(dcm.AcquisitionDateTime, "%Y%m%d%H%M%S.%f")
-            acq_times[folder_path] = acq_datetime
-        except Exception as e:
-            print(f"Warning: Could not read DICOM metadata for {dicom_files[0]}. Error: {e}")
-    return acq_times
+    """
+    Scans a session's subfolders to extract acquisition datetimes from DICOM metadata.
+    Returns a dictionary of folder path -> (acquisition datetime, DICOM file list).
+    """
+    folder_paths = glob.glob(os.path.join(session_path, '*/'))
+    # Header reads are I/O bound, so overlap them across folders.
+    with ThreadPoolExecutor(max_workers=DICOM_READ_WORKERS) as ex:
+        results = ex.map(read_acquisition_time, folder_paths)
+    return {folder_path: result for folder_path, result in zip(folder_paths, results)
+            if result is not None}
 
 
 def parse_rrdf_timestamps(rrdf_folder_path):
@@ -114,52 +177,88 @@ def parse_rrdf_timestamps(rrdf_folder_path):
     rrdf_times = {}
     for file_path in glob.glob(os.path.join(rrdf_folder_path, '*.h5')):
         filename = os.path.basename(file_path)
-        match = re.search(r'_(\d{8})_(\d{6})\.h5', filename)
+        match = RRDF_FILE_PATTERN.search(filename)
         if match:
-            date_part, time_part = match.groups()
-            rrdf_datetime = datetime.datetime.strptime(f"{date_part}{time_part}", "%Y%m%d%H%M%S")
+            # Build the datetime from the captured fields directly; strptime is much slower.
+            rrdf_datetime = datetime.datetime(*map(int, match.groups()))
             rrdf_times[file_path] = rrdf_datetime
     return rrdf_times
 
 
-def relocate_rrdf_files_by_time(temp_download_path, dicom_session_path):
-    """Moves each .h5 file to the DICOM acquisition folder with the closest timestamp."""
-    print(f"\n--- Starting RRDF Relocation for Session: {os.path.basename(dicom_session_path)} ---")
-    dicom_acq_times = get_dicom_acquisition_times(dicom_session_path)
+def to_microseconds(dt):
+    """Converts a naive datetime to an integer count of microseconds for cheap comparisons."""
+    return (dt - datetime.datetime.min) // datetime.timedelta(microseconds=1)
+
+
+def relocate_rrdf_files_by_time(temp_download_path, dicom_session_path, dicom_acq_times=None):
+    """
+    Moves each .h5 file to the DICOM acquisition folder with the closest timestamp.
+    dicom_acq_times may pass in an already completed get_dicom_acquisition_times() scan.
+    """
+    logger.info("\n--- Starting RRDF Relocation for Session: %s ---", os.path.basename(dicom_session_path))
+    if dicom_acq_times is None:
+        dicom_acq_times = get_dicom_acquisition_times(dicom_session_path)
     rrdf_file_times = parse_rrdf_timestamps(temp_download_path)
 
-    for rrdf_path, rrdf_time in rrdf_file_times.items():
-        best_match_folder, min_time_diff = None, datetime.timedelta(days=1)
-        # Find the DICOM acquisition with the minimum time difference.
-        for folder_path, dicom_datetime in dicom_acq_times.items():
-            time_diff = abs(dicom_datetime - rrdf_time)
-            if time_diff < min_time_diff:
-                min_time_diff, best_match_folder = time_diff, folder_path
+    # Sort acquisitions by time so each lookup is a bisection instead of a full scan.
+    # Times are compared as integer microseconds rather than datetime/timedelta objects.
+    sorted_dicom = sorted(dicom_acq_times.items(), key=lambda kv: kv[1][0])
+    sorted_folders = [folder_path for folder_path, _ in sorted_dicom]
+    sorted_times = [to_microseconds(dicom_datetime) for _, (dicom_datetime, _) in sorted_dicom]
+
+    moved_count = 0
+    for rrdf_path, rrdf_datetime in rrdf_file_times.items():
+        rrdf_time = to_microseconds(rrdf_datetime)
+        best_match_folder, min_time_diff = None, None
+        # The closest DICOM acquisition is one of the two neighbours of the insertion point.
+        # Check the one at or after the RRDF time first and stop early on an exact match.
+        idx = bisect.bisect_left(sorted_times, rrdf_time)
+        for i in (idx, idx - 1):
+            if not 0 <= i < len(sorted_times):
+                continue
+            time_diff = abs(sorted_times[i] - rrdf_time)
+            if min_time_diff is None or time_diff < min_time_diff:
+                min_time_diff, best_match_folder = time_diff, sorted_folders[i]
+            if time_diff < EXACT_MATCH_OFFSET_US:
+                break
 
         # Relocate if a close match is found (e.g., within 1 minute).
-        if best_match_folder and min_time_diff < datetime.timedelta(minutes=1):
-            original_rrdf_filename = os.path.basename(rrdf_path)
+        original_rrdf_filename = os.path.basename(rrdf_path)
+        if best_match_folder and min_time_diff < MAX_MATCH_OFFSET_US:
             dest_foldername = os.path.basename(os.path.normpath(best_match_folder))
             try:
-                print(f"Match found: Moving '{original_rrdf_filename}' -> '{dest_foldername}'")
-                shutil.move(rrdf_path, best_match_folder)
+                logger.debug("Match found: Moving '%s' -> '%s'", original_rrdf_filename, dest_foldername)
 
-                # Rename the moved .h5 file to match its new parent folder name.
-                moved_h5_path = os.path.join(best_match_folder, original_rrdf_filename)
+                # Move the .h5 file straight to its final name, matching its new parent folder.
                 new_h5_name = f"{dest_foldername}.h5"
                 final_h5_path = os.path.join(best_match_folder, new_h5_name)
-                print(f"  Renaming '{original_rrdf_filename}' -> '{new_h5_name}'")
-                os.rename(moved_h5_path, final_h5_path)
+                logger.debug("  Renaming '%s' -> '%s'", original_rrdf_filename, new_h5_name)
+                shutil.move(rrdf_path, final_h5_path)
+                moved_count += 1
 
                 # If this is a CALIPR acquisition, trigger special DICOM renaming.
                 if 'calipr' in dest_foldername.lower():
-                    rename_calipr_dicom_files(best_match_folder)
+                    acq_datetime, dicom_files = dicom_acq_times[best_match_folder]
+                    renamed_files = rename_calipr_dicom_files(best_match_folder, dicom_files)
+                    # Keep the cached file list valid for any later .h5 matched to this folder.
+                    if renamed_files:
+                        dicom_acq_times[best_match_folder] = (acq_datetime, renamed_files)
             except Exception as e:
-                print(f"  An error occurred during move/rename: {e}")
+                logger.error("  An error occurred during move/rename: %s", e)
         else:
-            print(f"Warning: No close time match for '{os.path.basename(rrdf_path)}'. Not moved.")
+            logger.warning("Warning: No close time match for '%s'. Not moved.", original_rrdf_filename)
+
+    logger.info("Relocated %s of %s RRDF files.", moved_count, len(rrdf_file_times))
 
 
+def list_subfolders(folder_path, follow_symlinks=False):
+    """Lists the directories directly inside a folder, by default excluding symlinked ones."""
+    try:
+        with os.scandir(folder_path) as entries:
+            return [e for e in entries if e.is_dir(follow_symlinks=follow_symlinks)]
+    except OSError:
+        return []
+
 def find_local_dicom_sessions(base_export_path):
     """
     Scans the local export directory and returns a dictionary of session paths
@@ -168,29 +267,90 @@ def find_local_dicom_sessions(base_export_path):
     """
     sessions = {}
     print(f"Scanning local directory '{base_export_path}' for DICOM sessions...")
-    
-    # Regex to match the date format used in export.lua
-    session_pattern = re.compile(r'(\d{4})-(\d{2})-(\d{2})_(\d{2})_(\d{2})_(\d{2})')
-
-    for root, dirs, files in os.walk(base_export_path):
-        for d in dirs:
-            match = session_pattern.match(d)
-            if match:
-                year, month, day, hour, minute, second = match.groups()
-                # Construct the expected RRDF folder name format
-                expected_rrdf_name = f"rrdf_{year}{month}{day}_{hour}{minute}{second}"
-                full_path = os.path.join(root, d)
-                sessions[expected_rrdf_name] = full_path
-                print(f"  Found session: {d} (Expected RRDF: {expected_rrdf_name})")
-    
+
+    # Only descend to the session level instead of walking every acquisition folder and file.
+    parent_paths = [base_export_path]
+    for _ in range(SESSION_FOLDER_DEPTH - 1):
+        parent_paths = [sub.path for path in parent_paths for sub in list_subfolders(path)]
+    # Like os.walk, never descend into symlinked directories but still match them as sessions.
+    folders = [sub for path in parent_paths for sub in list_subfolders(path, follow_symlinks=True)]
+
+    for folder in folders:
+        match = SESSION_FOLDER_PATTERN.match(folder.name)
+        if match:
+            year, month, day, hour, minute, second = match.groups()
+            # Construct the expected RRDF folder name format
+            expected_rrdf_name = f"rrdf_{year}{month}{day}_{hour}{minute}{second}"
+            sessions[expected_rrdf_name] = folder.path
+            print(f"  Found session: {folder.name} (Expected RRDF: {expected_rrdf_name})")
+
     return sessions
 
-def get_remote_rrdf_folders(ssh):
-    """Gets a list of all rrdf_ folders on the scanner."""
-    stdin, stdout, stderr = ssh.exec_command("ls -1 RRDF")
-    output = stdout.read().decode('ascii').split('\n')
-    # Filter for folders starting with 'rrdf_'
-    return [f.strip() for f in output if f.strip().startswith('rrdf_')]
+def get_remote_rrdf_folders(ssh, folder_names):
+    """Returns the subset of the given rrdf_ folder names that exist on the scanner."""
+    # Let the scanner check only the folders we need rather than listing all of RRDF.
+    # ls prints the names that exist and silently skips the rest.
+    quoted_names = ' '.join(f"'{name}'" for name in folder_names)
+    stdin, stdout, stderr = ssh.exec_command(f"cd RRDF && ls -1d {quoted_names} 2>/dev/null")
+    # Iterate the channel line by line instead of reading the whole output at once.
+    remote_folders = set()
+    for line in stdout:
+        name = line.strip()
+        if name.startswith('rrdf_'):
+            remote_folders.add(name)
+    return remote_folders
+
+def download_rrdf_folder_tar(ssh, rrdf_folder_name, local_dir):
+    """
+    Streams a remote RRDF folder into local_dir as a single tar archive.
+    One continuous stream avoids the per-file round-trips of a recursive SCP.
+    """
+    stdin, stdout, stderr = ssh.exec_command(f"tar cf - -C RRDF '{rrdf_folder_name}'")
+    try:
+        with tarfile.open(fileobj=stdout, mode='r|', bufsize=DOWNLOAD_BUFFER_SIZE,
+                          copybufsize=DOWNLOAD_BUFFER_SIZE) as tar:
+            if hasattr(tarfile, 'data_filter'):
+                tar.extractall(local_dir, filter='data')
+            else:
+                tar.extractall(local_dir)
+        if stdout.channel.recv_exit_status() != 0:
+            raise RuntimeError(f"Remote tar failed: {stderr.read().decode('ascii', 'replace').strip()}")
+    finally:
+        # Release the channel even if the stream broke off, so a stalled remote tar
+        # does not hold a session slot the SFTP fallback needs.
+        stdout.channel.close()
+
+def download_rrdf_folder_sftp(ssh, rrdf_folder_name, local_dir):
+    """Pulls the files of a remote RRDF folder over several SFTP channels in parallel."""
+    remote_path = f'RRDF/{rrdf_folder_name}'
+    local_path = os.path.join(local_dir, rrdf_folder_name)
+    os.makedirs(local_path, exist_ok=True)
+
+    transport = ssh.get_transport()
+    with paramiko.SFTPClient.from_transport(transport) as sftp:
+        file_names = [a.filename for a in sftp.listdir_attr(remote_path) if stat.S_ISREG(a.st_mode)]
+    if not file_names:
+        return
+
+    # Each worker opens its own channel and pulls an interleaved share of the files.
+    n_channels = min(SFTP_CHANNELS, len(file_names))
+    def pull(names):
+        with paramiko.SFTPClient.from_transport(transport) as sftp:
+            for name in names:
+                sftp.get(f'{remote_path}/{name}', os.path.join(local_path, name))
+
+    with ThreadPoolExecutor(max_workers=n_channels) as ex:
+        list(ex.map(pull, [file_names[i::n_channels] for i in range(n_channels)]))
+
+def download_rrdf_folder(ssh, rrdf_folder_name, local_dir):
+    """Downloads a remote RRDF folder, falling back to parallel SFTP if tar fails on the scanner."""
+    try:
+        download_rrdf_folder_tar(ssh, rrdf_folder_name, local_dir)
+    except (tarfile.TarError, RuntimeError) as e:
+        print(f"Tar download failed ({e}). Falling back to parallel SFTP...")
+        partial_path = os.path.join(local_dir, rrdf_folder_name)
+        if os.path.exists(partial_path): shutil.rmtree(partial_path)
+        download_rrdf_folder_sftp(ssh, rrdf_folder_name, local_dir)
 
 def main():
     """Main function to orchestrate the entire process."""
@@ -208,7 +368,10 @@ def main():
     ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
     try:
         print(f"\nConnecting to scanner at {SWOOP_IP}...")
-        ssh.connect(SWOOP_IP, username=SWOOP_USER, password=SWOOP_PASS, port=SWOOP_PORT)
+        # The scanner only accepts password auth; skip the agent and local key
+        # attempts paramiko would otherwise make first, each costing a round-trip.
+        ssh.connect(SWOOP_IP, username=SWOOP_USER, password=SWOOP_PASS, port=SWOOP_PORT,
+                    allow_agent=False, look_for_keys=False)
         print("Connection successful.\n")
     except Exception as e:
         print(f"Connection failed: {e}")
@@ -216,8 +379,8 @@ def main():
 
     try:
         # --- 2. Check Remote Folders ---
-        remote_folders = get_remote_rrdf_folders(ssh)
-        print(f"Found {len(remote_folders)} RRDF folders on the scanner.")
+        remote_folders = get_remote_rrdf_folders(ssh, local_sessions)
+        print(f"Found {len(remote_folders)} of {len(local_sessions)} expected RRDF folders on the scanner.")
 
         # --- 3. Process Each Local Session ---
         for expected_rrdf, local_session_path in local_sessions.items():
@@ -230,14 +393,17 @@ def main():
                 if os.path.exists(TEMP_DOWNLOAD_DIR): shutil.rmtree(TEMP_DOWNLOAD_DIR)
                 os.makedirs(TEMP_DOWNLOAD_DIR)
 
-                with SCPClient(ssh.get_transport()) as scp:
-                    scp.get(remote_path, recursive=True, local_path=TEMP_DOWNLOAD_DIR)
+                # The local DICOM header scan only needs the session path, so run it
+                # alongside the download instead of after it.
+                with ThreadPoolExecutor(max_workers=1) as ex:
+                    dicom_scan = ex.submit(get_dicom_acquisition_times, local_session_path)
+                    download_rrdf_folder(ssh, expected_rrdf, TEMP_DOWNLOAD_DIR)
 
                 temp_local_rrdf_path = os.path.join(TEMP_DOWNLOAD_DIR, expected_rrdf)
                 print("Download complete.")
 
                 # --- 5. Relocate and Rename ---
-                relocate_rrdf_files_by_time(temp_local_rrdf_path, local_session_path)
+                relocate_rrdf_files_by_time(temp_local_rrdf_path, local_session_path, dicom_scan.result())
 
                 # Optional: Delete from Scanner (Uncomment if desired)
                 # print(f"Deleting '{expected_rrdf}' from the remote server...")
@@ -260,4 +426,10 @@ def main():
         ssh.close()
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Sync RRDF (.h5) files from the Hyperfine scanner into the DICOM export.")
+    parser.add_argument('-v', '--verbose', action='store_true', help="log every RRDF file move and rename")
+    args = parser.parse_args()
+    # Per-file relocation messages are debug level so headless runs only log a per-session summary.
+    logging.basicConfig(stream=sys.stdout, format='%(message)s',
+                        level=logging.DEBUG if args.verbose else logging.INFO)
     main()
\ No newline at end of file
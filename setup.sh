@@ -120,7 +120,7 @@ setup_python_env() {
   fi
   
   echo "Installing Python packages..."
-  sudo -u "$ORTHANC_USER" sh -c "$PYTHON_ENV_DIR/bin/pip install paramiko pydicom scp"
+  sudo -u "$ORTHANC_USER" sh -c "$PYTHON_ENV_DIR/bin/pip install paramiko pydicom"
 }
 
 deploy_and_secure_files() {